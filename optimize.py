@@ -1,7 +1,30 @@
+import math
+import os
+import numpy as np
 import pandas as pd
 import random
-from dataclasses import dataclass
-from collections import defaultdict
+from dataclasses import dataclass, field
+from collections import defaultdict, deque
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # optional: without Numba the pure NumPy batch path is used
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    from numba import cuda
+    HAVE_CUDA = cuda.is_available()
+except ImportError:
+    HAVE_CUDA = False
+
+GPU_MIN_POP = 256  # below this, kernel launch overhead outweighs the GPU
+
+FLEETS = ("A", "B")  # fleet index -> label
 
 # ============================================================
 # DATA MODELS
@@ -20,53 +43,133 @@ class Well:
     well_id: str
     formation: str
     stages: list  # List[Stage]
+    assignments_by_mode: tuple = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Shared (stage, fleet) pairs for modes 0/1/2 (A, B, zipper), so
+        # build_assignments() reuses tuples instead of allocating new ones
+        self.assignments_by_mode = (
+            [(stage, 0) for stage in self.stages],
+            [(stage, 1) for stage in self.stages],
+            [(stage, i & 1) for i, stage in enumerate(self.stages)],
+        )
+
+
+@dataclass
+class StageTable:
+    """
+    Struct-of-arrays view of every stage, grouped by well (CSR layout):
+    the stages of well w are stage_start[w]:stage_start[w + 1].
+    Durations are float32 to halve memory traffic in the batch kernels;
+    the reported makespan is recomputed in float64 by simulate_full().
+    """
+    stage_start: np.ndarray  # (n_wells + 1,) int32
+    well_idx: np.ndarray     # (n_stages,) int32
+    order: np.ndarray        # (n_stages,) int32
+    duration: np.ndarray     # (n_stages,) float32, hours
 
 
 # ============================================================
 # LOAD EXCEL DATA
 # ============================================================
 
+WELL_COLUMNS = ["WELLNAME", "FORMATION", "# Stages", "PUMPTIME (min)"]
+
+
+def read_well_table(filepath):
+    """
+    Read only the columns the optimizer uses.
+    Excel goes through the calamine engine when python-calamine is installed
+    (falls back to openpyxl); .csv and .parquet inputs skip Excel entirely.
+    """
+    suffix = os.path.splitext(filepath)[1].lower()
+    if suffix == ".csv":
+        return pd.read_csv(filepath, usecols=WELL_COLUMNS)
+    if suffix == ".parquet":
+        return pd.read_parquet(filepath, columns=WELL_COLUMNS)
+    try:
+        return pd.read_excel(filepath, engine="calamine", usecols=WELL_COLUMNS)
+    except ImportError:  # python-calamine not installed
+        pass
+    except ValueError as e:
+        if "Unknown engine" not in str(e):  # pandas < 2.2 has no calamine engine
+            raise
+    return pd.read_excel(filepath, usecols=WELL_COLUMNS)
+
+
 def load_wells_from_excel(filepath):
     """
-    Load wells from Excel and convert numeric columns.
+    Load wells from Excel (or CSV/Parquet) and convert numeric columns.
     """
-    df = pd.read_excel(filepath)
+    df = read_well_table(filepath)
     wells = []
     stage_id = 0
 
     # Clean numeric columns
-    for col in ["# Stages", "RATE (bpm)", "CVOL (bbl)", "PUMPTIME (min)"]:
-        df[col] = df[col].astype(str).str.replace(",", "").astype(float)
+    for col in ["# Stages", "PUMPTIME (min)"]:
+        df[col] = pd.to_numeric(df[col].astype(str).str.replace(",", "", regex=False), errors="coerce")
+
+    bad = df[["# Stages", "PUMPTIME (min)"]].isna().any(axis=1)
+    if bad.any():
+        # +2: one for the header row, one because spreadsheet rows count from 1
+        bad_rows = ", ".join(f"{name} (row {i + 2})" for i, name in df.loc[bad, "WELLNAME"].items())
+        raise ValueError(f"Missing or non-numeric '# Stages' / 'PUMPTIME (min)' for: {bad_rows}")
+
+    # Pull whole columns once instead of building a Series per row
+    well_names = df["WELLNAME"].to_numpy()
+    formations = df["FORMATION"].to_numpy()
+    n_stages = df["# Stages"].to_numpy().astype(np.int32)
+    durations_hr = df["PUMPTIME (min)"].to_numpy() / 60.0  # minutes -> hours
+
+    rows = zip(well_names, formations, n_stages.tolist(), durations_hr.tolist())
+    for well_id, formation, n, duration_hr in rows:
+        stages = [Stage(stage_id + i, well_id, i, duration_hr) for i in range(n)]
+        stage_id += n
+        wells.append(Well(well_id, formation, stages))
 
-    for _, row in df.iterrows():
-        stages = []
-        duration_hr = row["PUMPTIME (min)"] / 60.0  # minutes -> hours
-        for i in range(int(row["# Stages"])):
-            stages.append(Stage(stage_id, row["WELLNAME"], i, duration_hr))
-            stage_id += 1
+    return wells
 
-        wells.append(Well(row["WELLNAME"], row["FORMATION"], stages))
 
-    return wells
+def build_stage_table(wells):
+    """
+    Flatten wells into a StageTable shared by every batch evaluation.
+    """
+    counts = np.array([len(w.stages) for w in wells], dtype=np.int32)
+    stage_start = np.zeros(len(wells) + 1, dtype=np.int32)
+    np.cumsum(counts, out=stage_start[1:])
+    return StageTable(
+        stage_start=stage_start,
+        well_idx=np.repeat(np.arange(len(wells), dtype=np.int32), counts),
+        order=np.array([s.order for w in wells for s in w.stages], dtype=np.int32),
+        duration=np.array([s.duration_hr for w in wells for s in w.stages], dtype=np.float32),
+    )
 
 
 # ============================================================
 # SCHEDULER
 # ============================================================
 
-def simulate(assignments):
-    fleet_time = {"A": 0.0, "B": 0.0}
-    well_time = defaultdict(float)
-    timeline = []
-
-    for stage, fleet in assignments:
-        start = max(fleet_time[fleet], well_time[stage.well_id])
+def simulate_full(assignments, wells):
+    """
+    Assignments are (stage, fleet) with fleet 0 = A, 1 = B.
+    Returns the makespan and the per-stage timeline
+    (well_id, order, fleet label, start, end) for reporting.
+    Well clocks are indexed by each well's position in `wells`.
+    """
+    well_of_stage = {id(stage): i for i, w in enumerate(wells) for stage in w.stages}
+    fleet_time = [0.0, 0.0]
+    well_time = [0.0] * len(wells)
+    timeline = [None] * len(assignments)
+
+    for k, (stage, fleet) in enumerate(assignments):
+        w = well_of_stage[id(stage)]
+        start = max(fleet_time[fleet], well_time[w])
         end = start + stage.duration_hr
         fleet_time[fleet] = end
-        well_time[stage.well_id] = end
-        timeline.append((stage.well_id, stage.order, fleet, start, end))
+        well_time[w] = end
+        timeline[k] = (stage.well_id, stage.order, FLEETS[fleet], start, end)
 
-    makespan = max(fleet_time.values())
+    makespan = max(fleet_time)
     return makespan, timeline
 
 
@@ -83,94 +186,542 @@ def detect_shared_wells(timeline):
 
 def random_chromosome(wells, num_shared=3):
     """
-    Chromosome: list of (well_id, mode)
+    Chromosome: list of (well_idx, mode), well_idx = position in `wells`
     mode: 0 = Fleet A, 1 = Fleet B, 2 = Shared
     Forces 'num_shared' wells to be shared initially.
     """
-    chromo = []
-    shared_indices = random.sample(range(len(wells)), num_shared)
-    for i, w in enumerate(wells):
-        if i in shared_indices:
-            mode = 2  # Shared
-        else:
-            mode = random.choice([0, 1])
-        chromo.append((w.well_id, mode))
-    random.shuffle(chromo)
-    return chromo
+    n = len(wells)
+    shared_indices = set(random.sample(range(n), num_shared))
+    randrange = random.randrange
+    # Walk the wells in a random permutation, so no separate shuffle pass
+    return [(i, 2 if i in shared_indices else randrange(2))
+            for i in random.sample(range(n), n)]
 
 
 def build_assignments(chromosome, wells):
     """
-    Build stage assignments for all wells.
+    Build stage assignments for all wells as (stage, fleet) pairs, fleet 0 = A, 1 = B.
     Shared wells alternate fleets (true zipper) to ensure both fleets are used.
     """
-    well_map = {w.well_id: w for w in wells}
     assignments = []
-    fleet_time = {"A": 0.0, "B": 0.0}
+    for well_idx, mode in chromosome:
+        assignments.extend(wells[well_idx].assignments_by_mode[mode])
+    return assignments
 
-    for well_id, mode in chromosome:
-        well = well_map[well_id]
 
-        if mode in [0, 1]:  # single-fleet
-            fleet = "A" if mode == 0 else "B"
-            for stage in well.stages:
-                assignments.append((stage, fleet))
-                fleet_time[fleet] += stage.duration_hr
+def eval_chromosome(chromosome, wells):
+    """
+    Makespan of a chromosome, same schedule as simulate_full() on
+    build_assignments(), but walked straight from the wells without
+    materializing the assignment list.
+    Each well appears once, so its clock starts at zero for its own stages.
+    """
+    fleet_time = [0.0, 0.0]
+
+    for well_idx, mode in chromosome:
+        stages = wells[well_idx].stages
+        if mode < 2:  # single-fleet: the well clock always equals the fleet clock
+            t = fleet_time[mode]
+            for stage in stages:
+                t += stage.duration_hr
+            fleet_time[mode] = t
         else:  # shared-well (zipper)
-            for i, stage in enumerate(well.stages):
-                fleet = "A" if i % 2 == 0 else "B"
-                assignments.append((stage, fleet))
-                fleet_time[fleet] += stage.duration_hr
+            well_time = 0.0
+            for i, stage in enumerate(stages):
+                f = i & 1
+                start = fleet_time[f] if fleet_time[f] > well_time else well_time
+                well_time = fleet_time[f] = start + stage.duration_hr
 
-    return assignments
+    return fleet_time[0] if fleet_time[0] > fleet_time[1] else fleet_time[1]
 
 
 def fitness(chromosome, wells):
-    assignments = build_assignments(chromosome, wells)
-    makespan, _ = simulate(assignments)
-    return makespan  # lower is better
+    return eval_chromosome(chromosome, wells)  # lower is better
+
+
+# ============================================================
+# GA: BATCH FITNESS (NumPy)
+# ============================================================
+
+def encode_population(population):
+    """
+    Encode chromosomes as two (pop, n_wells) arrays:
+    well_order holds the gene well indices, mode holds the gene mode (0/1/2).
+    """
+    well_order = np.array([[w for w, _ in c] for c in population], dtype=np.int32)
+    mode = np.array([[m for _, m in c] for c in population], dtype=np.int8)
+    return well_order, mode
+
+
+def expand_population(well_order, mode, table):
+    """
+    Expand encoded chromosomes into their stage sequences.
+    Returns (stage_well, stage_fleet, stage_dur), each of shape (pop, n_stages).
+    """
+    pop_size = well_order.shape[0]
+    counts = np.diff(table.stage_start)[well_order].ravel()
+    flat_mode = np.repeat(mode.ravel(), counts)
+
+    # Row in the table of each stage: each well's block is shifted from
+    # its position in the expanded sequence to its CSR offset
+    shift = table.stage_start[:-1][well_order].ravel() - (np.cumsum(counts) - counts)
+    stage_idx = np.arange(counts.sum()) + np.repeat(shift, counts)
+    flat_well = table.well_idx[stage_idx]
+    rank = table.order[stage_idx]
+
+    # Shared wells alternate A/B (zipper), others stay on one fleet
+    flat_fleet = np.where(flat_mode == 2, rank & 1, flat_mode)
+
+    return (flat_well.reshape(pop_size, -1),
+            flat_fleet.astype(np.int8).reshape(pop_size, -1),
+            table.duration[stage_idx].reshape(pop_size, -1))
+
+
+@njit(fastmath=True, cache=True)
+def simulate_nb(well_idx, duration, fleet, n_wells):
+    """
+    Compiled makespan of one expanded chromosome, same rules as simulate_full().
+    """
+    fleet_time = np.zeros(2, np.float32)
+    well_time = np.zeros(n_wells, np.float32)
+    for k in range(well_idx.size):
+        f = fleet[k]
+        w = well_idx[k]
+        s = fleet_time[f] if fleet_time[f] > well_time[w] else well_time[w]
+        e = s + duration[k]
+        fleet_time[f] = e
+        well_time[w] = e
+    return fleet_time[0] if fleet_time[0] > fleet_time[1] else fleet_time[1]
+
+
+@njit(parallel=True, cache=True)
+def eval_population(stage_well, stage_dur, stage_fleet, n_wells):
+    """
+    Run simulate_nb over every expanded chromosome, spread across CPU cores.
+    """
+    pop_size = stage_well.shape[0]
+    makespans = np.empty(pop_size, np.float32)
+    for i in prange(pop_size):
+        makespans[i] = simulate_nb(stage_well[i], stage_dur[i], stage_fleet[i], n_wells)
+    return makespans
+
+
+def simulate_batch(well_order, mode, table):
+    """
+    Makespan of every encoded chromosome, same rules as simulate_full().
+    With Numba the chromosomes are scored in parallel by eval_population;
+    otherwise the stage scan advances the whole population at once in NumPy.
+    """
+    pop_size, n_wells = well_order.shape
+    stage_well, stage_fleet, stage_dur = expand_population(well_order, mode, table)
+
+    if HAVE_NUMBA:
+        return eval_population(stage_well, stage_dur, stage_fleet, n_wells)
+
+    rows = np.arange(pop_size)
+    fleet_time = np.zeros((pop_size, 2), np.float32)
+    well_time = np.zeros((pop_size, n_wells), np.float32)
+    for k in range(stage_well.shape[1]):
+        f = stage_fleet[:, k]
+        w = stage_well[:, k]
+        end = np.maximum(fleet_time[rows, f], well_time[rows, w]) + stage_dur[:, k]
+        fleet_time[rows, f] = end
+        well_time[rows, w] = end
+
+    return fleet_time.max(axis=1)
+
+
+# ============================================================
+# GA: SPECIALIZED FITNESS (runtime code generation)
+# ============================================================
+
+SIMULATE_TEMPLATE = """
+@njit(parallel=True, fastmath=True)
+def simulate_spec(well_order, mode):
+    makespans = np.empty(well_order.shape[0], np.float32)
+    for p in prange(well_order.shape[0]):
+        ft0 = np.float32(0.0)
+        ft1 = np.float32(0.0)
+        for j in range({n_wells}):
+            w = well_order[p, j]
+            m = mode[p, j]
+            if m == 0:
+                ft0 += WELL_TOTAL[w]
+            elif m == 1:
+                ft1 += WELL_TOTAL[w]
+            else:
+                lo = STAGE_START[w]
+                hi = STAGE_START[w + 1]
+                wt = np.float32(0.0)
+                for k in range(lo, hi - 1, 2):
+                    wt = ft0 = (ft0 if ft0 > wt else wt) + DURATION[k]
+                    wt = ft1 = (ft1 if ft1 > wt else wt) + DURATION[k + 1]
+                if (hi - lo) & 1:  # odd stage count: the last stage goes to fleet A
+                    ft0 = (ft0 if ft0 > wt else wt) + DURATION[hi - 1]
+        makespans[p] = ft0 if ft0 > ft1 else ft1
+    return makespans
+"""
+
+
+def make_simulate(table):
+    """
+    Generate and compile simulate_spec(well_order, mode) -> makespans for
+    this pad. The well count is a literal loop bound, and the stage offsets,
+    durations and per-well totals are frozen in as constant arrays, so a
+    single-fleet well costs one add and a zipper well walks A/B stage pairs.
+    The generated code does not grow with the pad, but compiling still
+    takes around a second, so this only pays off on long runs.
+    """
+    n_wells = table.stage_start.size - 1
+    totals = np.array([table.duration[table.stage_start[w]:table.stage_start[w + 1]].sum(dtype=np.float64)
+                       for w in range(n_wells)], dtype=np.float32)
+    namespace = {"np": np, "njit": njit, "prange": prange, "STAGE_START": table.stage_start,
+                 "DURATION": table.duration, "WELL_TOTAL": totals}
+    exec(SIMULATE_TEMPLATE.format(n_wells=n_wells), namespace)
+    simulate_spec = namespace["simulate_spec"]
+
+    def simulate(well_order, mode):
+        # The kernel indexes its constant arrays unchecked: a stray well index
+        # or a mismatched pad would read out of bounds instead of raising
+        if well_order.shape[1:] != (n_wells,) or mode.shape != well_order.shape:
+            raise ValueError(f"expected (pop, {n_wells}) well_order/mode, got "
+                             f"{well_order.shape} / {mode.shape}")
+        if well_order.size and (well_order.min() < 0 or well_order.max() >= n_wells):
+            raise ValueError(f"well index out of range for a {n_wells}-well pad")
+        return simulate_spec(well_order, mode)
+
+    return simulate
+
+
+# ============================================================
+# GA: GPU FITNESS (Numba CUDA)
+# ============================================================
+
+if HAVE_CUDA:
+    @cuda.jit
+    def eval_kernel(d_well_order, d_mode, d_stage_start, d_duration, d_out):
+        """
+        One thread per chromosome; same rules as simulate_full().
+        Each well appears once per chromosome, so its finish time is a
+        running scalar instead of a per-thread well_time array.
+        """
+        i = cuda.grid(1)
+        if i >= d_out.size:
+            return
+        ft0 = np.float32(0.0)
+        ft1 = np.float32(0.0)
+        for j in range(d_well_order.shape[1]):
+            w = d_well_order[i, j]
+            m = d_mode[i, j]
+            wt = np.float32(0.0)
+            for k in range(d_stage_start[w], d_stage_start[w + 1]):
+                f = (k - d_stage_start[w]) & 1 if m == 2 else m
+                ft = ft0 if f == 0 else ft1
+                e = (ft if ft > wt else wt) + d_duration[k]
+                if f == 0:
+                    ft0 = e
+                else:
+                    ft1 = e
+                wt = e
+        d_out[i] = ft0 if ft0 > ft1 else ft1
+
+
+def make_cuda_evaluator(table, threads_per_block=128):
+    """
+    Return evaluate(well_order, mode) -> makespans running eval_kernel.
+    Stage data is uploaded once; only the encoded chromosomes move per call,
+    and the output buffer is reused across generations.
+    """
+    d_stage_start = cuda.to_device(table.stage_start)
+    d_duration = cuda.to_device(table.duration)
+    d_out = cuda.device_array(0, dtype=np.float32)
+
+    def evaluate(well_order, mode):
+        nonlocal d_out
+        n = well_order.shape[0]
+        if d_out.size < n:
+            d_out = cuda.device_array(n, dtype=np.float32)
+        blocks = (n + threads_per_block - 1) // threads_per_block
+        eval_kernel[blocks, threads_per_block](
+            cuda.to_device(well_order), cuda.to_device(mode),
+            d_stage_start, d_duration, d_out[:n])
+        return d_out[:n].copy_to_host()
+
+    return evaluate
 
 
 # ============================================================
 # GA OPERATORS
 # ============================================================
+# Inside the GA a chromosome is one row of two arrays from
+# encode_population(): well order (int32) and mode (int8).
 
-def crossover(p1, p2):
-    cut = random.randint(1, len(p1) - 2)
-    child = p1[:cut]
-    used = {w for w, _ in child}
-    for gene in p2:
-        if gene[0] not in used:
-            child.append(gene)
-    return child
+@njit(cache=True)
+def crossover_nb(order1, mode1, order2, mode2, cut, out_order, out_mode):
+    """
+    Copy parent 1 up to `cut`, then append the remaining wells in parent 2's order.
+    """
+    seen = np.zeros(order1.size, np.bool_)
+    for i in range(cut):
+        out_order[i] = order1[i]
+        out_mode[i] = mode1[i]
+        seen[order1[i]] = True
+    j = cut
+    for i in range(order2.size):
+        w = order2[i]
+        if not seen[w]:
+            out_order[j] = w
+            out_mode[j] = mode2[i]
+            j += 1
+
+
+@njit(cache=True)
+def mutate_nb(order, mode, gene, new_mode, swap_a, swap_b):
+    """
+    Set the mode at position `gene` and swap positions swap_a / swap_b.
+    A negative `gene` or `swap_a` skips that step.
+    """
+    if gene >= 0:
+        mode[gene] = new_mode
+    if swap_a >= 0:  # swap two wells instead of reshuffling all of them
+        order[swap_a], order[swap_b] = order[swap_b], order[swap_a]
+        mode[swap_a], mode[swap_b] = mode[swap_b], mode[swap_a]
 
 
-def mutate(chromosome, rate=0.2):
-    if random.random() < rate:
-        i = random.randint(0, len(chromosome) - 1)
-        well_id, mode = chromosome[i]
-        chromosome[i] = (well_id, random.choice([0, 1, 2]))
-    random.shuffle(chromosome)
+@njit(cache=True)
+def breed_nb(orders, modes, parent1, parent2, cuts, genes, new_modes, swap_a, swap_b,
+             out_orders, out_modes):
+    for c in range(parent1.size):
+        p1 = parent1[c]
+        p2 = parent2[c]
+        crossover_nb(orders[p1], modes[p1], orders[p2], modes[p2], cuts[c],
+                     out_orders[c], out_modes[c])
+        mutate_nb(out_orders[c], out_modes[c], genes[c], new_modes[c], swap_a[c], swap_b[c])
 
 
 # ============================================================
 # GA OPTIMIZER
 # ============================================================
 
-def optimize(wells, pop_size=100, generations=400, num_shared=3):
-    population = [random_chromosome(wells, num_shared=num_shared) for _ in range(pop_size)]
+ELITES = 10           # best chromosomes carried unchanged into the next generation
+PARENT_POOL = 30      # parents are drawn from this many top-ranked chromosomes
+TOURNAMENT_SIZE = 2   # binary tournament; larger k converged prematurely here
+MUTATION_RATE = 0.2
+
+
+def tournament(rng, pool_size, size, k=TOURNAMENT_SIZE):
+    """
+    Tournament selection on a population sorted best-first: each winner
+    is the lowest of k ranks drawn from the top pool_size.
+    """
+    return rng.integers(0, pool_size, (size, k)).min(axis=1)
+
+
+def breed(orders, modes, n_children, pool_size, rng, rate=MUTATION_RATE):
+    """
+    Produce n_children offspring from a population sorted best-first.
+    All random draws happen here in bulk; breed_nb does the per-gene work.
+    """
+    n_wells = orders.shape[1]
+    parent1 = tournament(rng, pool_size, n_children)
+    parent2 = tournament(rng, pool_size, n_children)
+    cuts = rng.integers(1, n_wells - 1, n_children)
+    genes = np.where(rng.random(n_children) < rate, rng.integers(0, n_wells, n_children), -1)
+    new_modes = rng.integers(0, 3, n_children).astype(np.int8)
+    swap_a = np.where(rng.random(n_children) < rate, rng.integers(0, n_wells, n_children), -1)
+    swap_b = (swap_a + rng.integers(1, n_wells, n_children)) % n_wells
+
+    out_orders = np.empty((n_children, n_wells), dtype=orders.dtype)
+    out_modes = np.empty((n_children, n_wells), dtype=modes.dtype)
+    breed_nb(orders, modes, parent1, parent2, cuts, genes, new_modes, swap_a, swap_b,
+             out_orders, out_modes)
+    return out_orders, out_modes
+
+
+def optimize(wells, pop_size=100, generations=400, num_shared=3, specialize=False):
+    """
+    Genetic search over well order and fleet modes; returns the best chromosome.
+    specialize=True scores with a make_simulate() kernel compiled for this
+    pad (Numba only), worth its compile time on long runs.
+    """
+    table = build_stage_table(wells)
+    orders, modes = encode_population(
+        [random_chromosome(wells, num_shared=num_shared) for _ in range(pop_size)])
+
+    if HAVE_CUDA and pop_size >= GPU_MIN_POP:
+        simulate_encoded = make_cuda_evaluator(table)
+    elif specialize and HAVE_NUMBA:
+        simulate_encoded = make_simulate(table)
+    else:
+        def simulate_encoded(well_order, mode):
+            return simulate_batch(well_order, mode, table)
+
+    # Seeded from `random` so random.seed() still reproduces a whole run
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    # Elites and repeated offspring are re-seen every generation; memoize
+    # their makespan so each distinct chromosome is only simulated once.
+    cache = {}
+
+    def evaluate(orders, modes):
+        keys = [o.tobytes() + m.tobytes() for o, m in zip(orders, modes)]
+        unseen = {}
+        for i, k in enumerate(keys):
+            if k not in cache:
+                unseen.setdefault(k, i)
+        if unseen:
+            rows = list(unseen.values())
+            makespans = simulate_encoded(orders[rows], modes[rows])
+            cache.update(zip(unseen, makespans.tolist()))
+        return np.array([cache[k] for k in keys])
+
+    pool_size = min(PARENT_POOL, pop_size)
+    n_children = max(pop_size - ELITES, 0)
+    best_score, best = float("inf"), None
+    for gen in range(generations + 1):
+        # Score once per generation; the sorted head is that generation's best
+        rank = np.argsort(evaluate(orders, modes), kind="stable")
+        orders, modes = orders[rank], modes[rank]
+        score = cache[orders[0].tobytes() + modes[0].tobytes()]
+        if score < best_score:
+            best_score = score
+            best = list(zip(orders[0].tolist(), modes[0].tolist()))
+        if gen == generations:
+            break
+
+        child_orders, child_modes = breed(orders, modes, n_children, pool_size, rng)
+        orders = np.concatenate((orders[:ELITES], child_orders))
+        modes = np.concatenate((modes[:ELITES], child_modes))
+
+    return best
+
+
+# ============================================================
+# LOCAL SEARCH: SIMULATED ANNEALING / TABU
+# ============================================================
+# Single-trajectory alternatives to optimize() that need far fewer
+# fitness evaluations than a full GA on small pads.
+
+def memoized_fitness(wells):
+    """
+    Return score(chromosome) -> fitness over `wells`, cached per chromosome.
+    """
+    cache = {}
+
+    def score(chromosome):
+        key = tuple(chromosome)
+        if key not in cache:
+            cache[key] = fitness(chromosome, wells)
+        return cache[key]
 
-    for _ in range(generations):
-        population.sort(key=lambda c: fitness(c, wells))
-        next_gen = population[:10]
-        while len(next_gen) < pop_size:
-            p1, p2 = random.sample(population[:30], 2)
-            child = crossover(p1, p2)
-            mutate(child)
-            next_gen.append(child)
-        population = next_gen
+    return score
 
-    return min(population, key=lambda c: fitness(c, wells))
+
+def random_neighbor(chromosome):
+    """
+    Copy of chromosome with one random move: a new mode for one well,
+    a swap of two wells' positions, or a swap of two wells' modes.
+    """
+    child = list(chromosome)
+    n = len(child)
+    move = random.randrange(3)
+    if move == 2:
+        i = random.randrange(n)
+        others = [j for j in range(n) if child[j][1] != child[i][1]]
+        if others:
+            j = random.choice(others)
+            (wi, mi), (wj, mj) = child[i], child[j]
+            child[i], child[j] = (wi, mj), (wj, mi)
+            return child
+        move = 0  # every well has the same mode: nothing to exchange
+    if move == 0:
+        i = random.randrange(n)
+        well_idx, mode = child[i]
+        child[i] = (well_idx, (mode + random.randrange(1, 3)) % 3)  # always a different mode
+    else:
+        i, j = random.sample(range(n), 2)
+        child[i], child[j] = child[j], child[i]
+    return child
+
+
+def neighbors(chromosome):
+    """
+    Yield (move, reverse, child) for every single mode change, every swap of
+    two wells' positions and every swap of two wells' modes;
+    `reverse` identifies the move that would undo `move`.
+    """
+    n = len(chromosome)
+    for i, (well_idx, mode) in enumerate(chromosome):
+        for new_mode in range(3):
+            if new_mode != mode:
+                child = list(chromosome)
+                child[i] = (well_idx, new_mode)
+                yield ("mode", well_idx, new_mode), ("mode", well_idx, mode), child
+    for i in range(n):
+        for j in range(i + 1, n):
+            (wi, mi), (wj, mj) = chromosome[i], chromosome[j]
+            pair = (min(wi, wj), max(wi, wj))
+            child = list(chromosome)
+            child[i], child[j] = (wj, mj), (wi, mi)
+            yield ("swap",) + pair, ("swap",) + pair, child
+            if mi != mj:
+                child = list(chromosome)
+                child[i], child[j] = (wi, mj), (wj, mi)
+                yield ("exchange",) + pair, ("exchange",) + pair, child
+
+
+def optimize_sa(wells, iters=5000, T0=5.0, alpha=0.999, num_shared=3):
+    """
+    Simulated annealing from one random chromosome. Worse moves are
+    accepted with probability exp(-delta / T); T starts at T0 (hours)
+    and decays by alpha per iteration. Once T reaches 0 (T0 or alpha of 0,
+    or underflow on very long runs) only non-worsening moves are accepted.
+    """
+    score = memoized_fitness(wells)
+    current = random_chromosome(wells, num_shared=num_shared)
+    current_score = score(current)
+    best, best_score = current, current_score
+    T = T0
+
+    for _ in range(iters):
+        candidate = random_neighbor(current)
+        candidate_score = score(candidate)
+        delta = candidate_score - current_score
+        if delta <= 0 or (T > 0 and random.random() < math.exp(-delta / T)):
+            current, current_score = candidate, candidate_score
+            if current_score < best_score:
+                best, best_score = current, current_score
+        T *= alpha
+
+    return best
+
+
+def optimize_tabu(wells, iters=200, tenure=50, num_shared=3):
+    """
+    Tabu search: move to the best neighbor each iteration, except moves
+    that undo one of the last `tenure` moves, unless they beat the best so far.
+    """
+    score = memoized_fitness(wells)
+    current = random_chromosome(wells, num_shared=num_shared)
+    best, best_score = current, score(current)
+    tabu = deque(maxlen=tenure)
+
+    for _ in range(iters):
+        chosen = None
+        for move, reverse, candidate in neighbors(current):
+            candidate_score = score(candidate)
+            if move in tabu and candidate_score >= best_score:
+                continue
+            if chosen is None or candidate_score < chosen[0]:
+                chosen = (candidate_score, reverse, candidate)
+        if chosen is None:
+            break
+        current_score, reverse, current = chosen
+        tabu.append(reverse)
+        if current_score < best_score:
+            best, best_score = current, current_score
+
+    return best
 
 
 # ============================================================
@@ -183,14 +734,14 @@ if __name__ == "__main__":
     best_chromo = optimize(wells, num_shared=3)
 
     assignments = build_assignments(best_chromo, wells)
-    makespan, timeline = simulate(assignments)
+    makespan, timeline = simulate_full(assignments, wells)
     shared_wells = detect_shared_wells(timeline)
 
     print("\nOPTIMAL WELL PLAN")
     print("----------------")
-    for well_id, mode in best_chromo:
+    for well_idx, mode in best_chromo:
         label = ["Fleet A", "Fleet B", "Shared"][mode]
-        print(f"{well_id}: {label}")
+        print(f"{wells[well_idx].well_id}: {label}")
 
     print("\nSHARED (ZIPPER) WELLS")
     print("--------------------")